@@ -1,8 +1,10 @@
-from enum import Enum
+from asyncio import Semaphore, gather
+from collections import Counter
 from typing import Dict, Tuple, List
 from datetime import datetime
 
-from pytz import timezone, utc
+from numpy import array, bincount, timedelta64
+from pytz import timezone
 
 from manager_download import DownloadManager as DM
 from manager_environment import EnvironmentManager as EM
@@ -14,39 +16,39 @@ DAY_TIME_EMOJI = ["🌞", "🌆", "🌃", "🌙"]  # Emojis, representing differ
 DAY_TIME_NAMES = ["Morning", "Daytime", "Evening", "Night"]  # Localization identifiers for different times of day.
 WEEK_DAY_NAMES = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]  # Localization identifiers for different days of week.
 
+_LOCALIZED_LABELS = dict()  # Translated day-time and week-day labels, cached on first use.
 
-class Symbol(Enum):
+
+def _localized_labels() -> Tuple[List[str], List[str]]:
     """
-    Symbol version enum.
-    Allows to retrieve symbols pairs by calling `Symbol.get_symbols(version)`.
+    Get translated day-time and week-day label lists.
+    The labels only depend on constants and the configured locale, so they are computed on first use and cached.
+    NB! The localization manager must be initialized before the first call.
+
+    :returns: Tuple of day-time and week-day label lists.
     """
+    if not _LOCALIZED_LABELS:
+        _LOCALIZED_LABELS["day_times"] = [f"{DAY_TIME_EMOJI[i]} {LM.t(DAY_TIME_NAMES[i])}" for i in range(len(DAY_TIME_NAMES))]
+        _LOCALIZED_LABELS["week_days"] = [LM.t(week_day) for week_day in WEEK_DAY_NAMES]
+    return _LOCALIZED_LABELS["day_times"], _LOCALIZED_LABELS["week_days"]
 
-    VERSION_1 = "█", "░"
-    VERSION_2 = "⣿", "⣀"
-    VERSION_3 = "⬛", "⬜"
 
-    @staticmethod
-    def get_symbols(version: int) -> Tuple[str, str]:
-        """
-        Retrieves symbols pair for specified version.
+SYMBOL_VERSIONS = (("█", "░"), ("⣿", "⣀"), ("⬛", "⬜"))  # Filled and empty progress bar symbol pairs, indexed by version.
 
-        :param version: Required symbols version.
-        :returns: Two strings for filled and empty symbol value in a tuple.
-        """
-        return Symbol[f"VERSION_{version}"].value
+_SYMBOLS = SYMBOL_VERSIONS[EM.SYMBOL_VERSION - 1]  # Filled and empty progress bar symbols, resolved once at import time.
+_BARS = [_SYMBOLS[0] * done + _SYMBOLS[1] * (25 - done) for done in range(26)]  # Every possible progress bar, precomputed at import time.
 
 
 def make_graph(percent: float):
     """
     Make text progress bar.
     Length of the progress bar is 25 characters.
+    The bars are precomputed for all 26 possible fill levels, so making one is a single list index.
 
     :param percent: Completion percent of the progress bar.
     :return: The string progress bar representation.
     """
-    done_block, empty_block = Symbol.get_symbols(EM.SYMBOL_VERSION)
-    percent_quart = round(percent / 4)
-    return f"{done_block * percent_quart}{empty_block * (25 - percent_quart)}"
+    return _BARS[min(25, max(0, round(percent / 4)))]
 
 
 def make_list(data: List = None, names: List[str] = None, texts: List[str] = None, percents: List[float] = None, top_num: int = 5, sort: bool = True) -> str:
@@ -63,20 +65,50 @@ def make_list(data: List = None, names: List[str] = None, texts: List[str] = Non
     :param texts: list of texts (quantity descriptions), overloads data if defined.
     :param percents: list of percents (total percentages), overloads data if defined.
     :param top_num: how many measures to display, default: 5.
-    :param sort: if measures should be sorted by total percentage, default: True.
+    :param sort: if measures should be sorted by total percentage, default: True. Pass False for measures that are already sorted descending.
     :returns: The string representation of the list.
     """
     if data is not None:
-        names = [value for item in data for key, value in item.items() if key == "name"] if names is None else names
-        texts = [value for item in data for key, value in item.items() if key == "text"] if texts is None else texts
-        percents = [value for item in data for key, value in item.items() if key == "percent"] if percents is None else percents
+        unpacked_names, unpacked_texts, unpacked_percents = list(), list(), list()
+        for item in data:
+            unpacked_names.append(item["name"])
+            unpacked_texts.append(item["text"])
+            unpacked_percents.append(item["percent"])
+        names = unpacked_names if names is None else names
+        texts = unpacked_texts if texts is None else texts
+        percents = unpacked_percents if percents is None else percents
 
     data = list(zip(names, texts, percents))
     top_data = sorted(data[:top_num], key=lambda record: record[2], reverse=True) if sort else data[:top_num]
-    data_list = [f"{n[:25]}{' ' * (25 - len(n))}{t}{' ' * (20 - len(t))}{make_graph(p)}   {p:05.2f} % " for n, t, p in top_data]
+    data_list = [f"{n[:25].ljust(25)}{t.ljust(20)}{make_graph(p)}   {p:05.2f} % " for n, t, p in top_data]
     return "\n".join(data_list)
 
 
+async def _fetch_committed_dates_per_repo(repos: List[Dict]) -> List[Dict]:
+    """
+    Fetch commit dates with one `repo_committed_dates` query per repository.
+    Queries are run concurrently, bounded by a semaphore to respect GitHub secondary rate limits.
+    Repositories whose queries fail are reported and skipped.
+
+    :param repos: List of repository dictionaries, each containing "owner" and "name" keys.
+    :returns: List of per-repository response dictionaries.
+    """
+    semaphore = Semaphore(8)
+
+    async def fetch_committed_dates(repository: Dict) -> Dict:
+        async with semaphore:
+            return await DM.get_remote_graphql("repo_committed_dates", owner=repository["owner"]["login"], name=repository["name"], id=GHM.USER.node_id)
+
+    results = await gather(*[fetch_committed_dates(repository) for repository in repos], return_exceptions=True)
+    histories = list()
+    for repository, result in zip(repos, results):
+        if isinstance(result, BaseException):
+            print(f"Skipping repo: {repository['name']} ({result})")
+        else:
+            histories += [result["data"]["repository"]]
+    return histories
+
+
 async def make_commit_day_time_list(time_zone: str) -> str:
     """
     Calculate commit-related info, how many commits were made, and at what time of day and day of week.
@@ -89,37 +121,46 @@ async def make_commit_day_time_list(time_zone: str) -> str:
     result = await DM.get_remote_graphql("repos_contributed_to", username=GHM.USER.login)
     repos = [d for d in result["data"]["user"]["repositoriesContributedTo"]["nodes"] if d["isFork"] is False]
 
-    day_times = [0] * 4  # 0 - 6, 6 - 12, 12 - 18, 18 - 24
-    week_days = [0] * 7  # Monday, Tuesday, Wednesday, Thursday, Friday, Saturday, Sunday
-
-    for repository in repos:
-        result = await DM.get_remote_graphql("repo_committed_dates", owner=repository["owner"]["login"], name=repository["name"], id=GHM.USER.node_id)
-        if result["data"]["repository"] is None or result["data"]["repository"]["defaultBranchRef"] is None:
+    try:
+        repo_keys = [dict(owner=repository["owner"]["login"], name=repository["name"]) for repository in repos]
+        result = await DM.get_remote_graphql("repos_committed_dates_batch", repos=repo_keys, id=GHM.USER.node_id)
+        histories = list(result["data"].values())
+    except Exception as exception:
+        print(f"Batched commit dates query failed ({exception}), falling back to per-repository queries...")
+        histories = await _fetch_committed_dates_per_repo(repos)
+
+    committed_dates = list()
+    for repository in histories:
+        if repository is None or repository["defaultBranchRef"] is None:
             continue
+        committed_dates += [node["committedDate"].rstrip("Z") for node in repository["defaultBranchRef"]["target"]["history"]["nodes"]]
 
-        committed_dates = result["data"]["repository"]["defaultBranchRef"]["target"]["history"]["nodes"]
-        for committed_date in committed_dates:
-            local_date = datetime.strptime(committed_date["committedDate"], "%Y-%m-%dT%H:%M:%SZ")
-            date = local_date.replace(tzinfo=utc).astimezone(timezone(time_zone))
+    day_times = [0] * 4  # 0 - 6, 6 - 12, 12 - 18, 18 - 24
+    week_days = [0] * 7  # Monday, Tuesday, Wednesday, Thursday, Friday, Saturday, Sunday
 
-            day_times[date.hour // 6] += 1
-            week_days[date.isoweekday() - 1] += 1
+    if len(committed_dates) > 0:
+        offset_seconds = int(timezone(time_zone).utcoffset(datetime.now()).total_seconds())
+        local_dates = array(committed_dates, dtype="datetime64[s]") + timedelta64(offset_seconds, "s")
+        hours = local_dates.astype("datetime64[h]").astype(int) % 24
+        weekdays = (local_dates.astype("datetime64[D]").astype(int) + 3) % 7  # The UNIX epoch day (1970-01-01) is a Thursday.
+        day_times = bincount(hours // 6, minlength=4).tolist()
+        week_days = bincount(weekdays, minlength=7).tolist()
 
     sum_day = sum(day_times)
     sum_week = sum(week_days)
     day_times = day_times[1:] + day_times[:1]
 
-    dt_names = [f"{DAY_TIME_EMOJI[i]} {LM.t(DAY_TIME_NAMES[i])}" for i in range(len(day_times))]
+    dt_names, wd_names = _localized_labels()
     dt_texts = [f"{day_time} commits" for day_time in day_times]
     dt_percents = [round((day_time / sum_day) * 100, 2) for day_time in day_times]
     title = LM.t("I am an Early") if sum(day_times[0:2]) >= sum(day_times[2:4]) else LM.t("I am a Night")
     stats += f"**{title}** \n\n```text\n{make_list(names=dt_names, texts=dt_texts, percents=dt_percents, top_num=7, sort=False)}\n```\n"
 
     if EM.SHOW_DAYS_OF_WEEK:
-        wd_names = [LM.t(week_day) for week_day in WEEK_DAY_NAMES]
         wd_texts = [f"{week_day} commits" for week_day in week_days]
         wd_percents = [round((week_day / sum_week) * 100, 2) for week_day in week_days]
-        title = LM.t("I am Most Productive on") % wd_names[wd_percents.index(max(wd_percents))]
+        top_day = max(range(len(wd_percents)), key=wd_percents.__getitem__)
+        title = LM.t("I am Most Productive on") % wd_names[top_day]
         stats += f"📅 **{title}** \n\n```text\n{make_list(names=wd_names, texts=wd_texts, percents=wd_percents, top_num=7, sort=False)}\n```\n"
 
     return stats
@@ -132,17 +173,17 @@ def make_language_per_repo_list(repositories: Dict) -> str:
     :param repositories: User repositories.
     :returns: string representation of statistics.
     """
-    language_count = dict()
     repos_with_language = [repo for repo in repositories["data"]["user"]["repositories"]["nodes"] if repo["primaryLanguage"] is not None]
-    for repo in repos_with_language:
-        language = repo["primaryLanguage"]["name"]
-        language_count[language] = language_count.get(language, {"count": 0})
-        language_count[language]["count"] += 1
-
-    names = list(language_count.keys())
-    texts = [f"{language_count[lang]['count']} {'repo' if language_count[lang]['count'] == 1 else 'repos'}" for lang in names]
-    percents = [round(language_count[lang]["count"] / len(repos_with_language) * 100, 2) for lang in names]
-
-    top_language = max(list(language_count.keys()), key=lambda x: language_count[x]["count"])
-    title = f"**{LM.t('I Mostly Code in') % top_language}** \n\n" if len(repos_with_language) > 0 else ""
-    return f"{title}```text\n{make_list(names=names, texts=texts, percents=percents)}\n```\n\n"
+    language_count = Counter(repo["primaryLanguage"]["name"] for repo in repos_with_language)
+    total = sum(language_count.values())
+
+    names = list()
+    texts = list()
+    percents = list()
+    for language, count in language_count.most_common():
+        names.append(language)
+        texts.append(f"{count} {'repo' if count == 1 else 'repos'}")
+        percents.append(round(count / total * 100, 2))
+
+    title = f"**{LM.t('I Mostly Code in') % names[0]}** \n\n" if len(repos_with_language) > 0 else ""
+    return f"{title}```text\n{make_list(names=names, texts=texts, percents=percents, sort=False)}\n```\n\n"
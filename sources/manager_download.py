@@ -1,4 +1,4 @@
-from asyncio import Task
+from asyncio import Task, gather
 from hashlib import md5
 from json import dumps
 from string import Template
@@ -54,6 +54,26 @@ GITHUB_API_QUERIES = {
         }
     }
 }""",
+    # Query to collect commit dates for many repositories in one request, one aliased sub-query per repository.
+    # NB! This is a sub-query template, the full query is assembled by `DownloadManager._fetch_graphql_batched`.
+    "repos_committed_dates_batch": """
+    $alias: repository(owner: "$owner", name: "$name") {
+        defaultBranchRef {
+            target {
+                ... on Commit {
+                    history(first: 100, author: { id: "$id" }) {
+                        nodes {
+                            committedDate
+                        }
+                        pageInfo {
+                            endCursor
+                            hasNextPage
+                        }
+                    }
+                }
+            }
+        }
+    }""",
     # Query to collect info about all repositories user created or collaborated on, including: name, primary language and owner login.
     # NB! Query doesn't include information about repositories user contributed to via pull requests.
     "user_repository_list": """
@@ -121,6 +141,9 @@ GITHUB_API_QUERIES = {
 """,
 }
 
+# Pre-compile every query into a `Template` once at import time instead of re-constructing it on every request.
+GITHUB_API_QUERIES = {name: Template(query) for name, query in GITHUB_API_QUERIES.items()}
+
 
 async def init_download_manager():
     """
@@ -134,6 +157,7 @@ async def init_download_manager():
             "waka_latest": f"https://wakatime.com/api/v1/users/current/stats/last_7_days?api_key={EM.WAKATIME_API_KEY}",
             "waka_all": f"https://wakatime.com/api/v1/users/current/all_time_since_today?api_key={EM.WAKATIME_API_KEY}",
             "github_stats": f"https://github-contributions.vercel.app/api/v1/{GHM.USER.login}",
+            "github_views": f"https://api.github.com/repos/{GHM.USER.login}/{GHM.USER.login}/traffic/views?per=week",
         },
         {"Authorization": f"Bearer {EM.GH_TOKEN}"},
     )
@@ -153,6 +177,7 @@ class DownloadManager:
 
     _client = AsyncClient(timeout=60.0)
     _REMOTE_RESOURCES_CACHE = dict()
+    _QUERY_BATCH_SIZE = 25  # Number of aliased sub-queries to pack into one batched GraphQL request.
 
     @staticmethod
     async def load_remote_resources(resources: Dict[str, str], github_headers: Dict[str, str]):
@@ -225,12 +250,61 @@ class DownloadManager:
         :param kwargs: Parameters for substitution of variables in dynamic query.
         :return: Response JSON dictionary.
         """
-        res = await DownloadManager._client.post("https://api.github.com/graphql", json={"query": Template(GITHUB_API_QUERIES[query]).substitute(kwargs)})
+        res = await DownloadManager._client.post("https://api.github.com/graphql", json={"query": GITHUB_API_QUERIES[query].substitute(kwargs)})
         if res.status_code == 200:
             return res.json()
         else:
             raise Exception(f"Query '{query}' failed to run by returning code of {res.status_code}: {res.json()}")
 
+    @staticmethod
+    async def _fetch_graphql_batched(query: str, repos: List[Dict], **kwargs) -> Dict:
+        """
+        Execute GitHub GraphQL API query for many repositories at once.
+        The sub-query defined by `query` is repeated for every repository under a `repoN` alias, chunked to respect GitHub query complexity limits.
+        :param query: Dynamic sub-query identifier.
+        :param repos: List of repository dictionaries, each containing "owner" and "name" keys.
+        :param kwargs: Parameters for substitution of variables in dynamic sub-query.
+        :return: Response JSON dictionary, mapping every `repoN` alias to the corresponding sub-query response.
+        """
+        data = dict()
+        aliases = {f"repo{index}": repo for index, repo in enumerate(repos)}
+        for chunk_start in range(0, len(repos), DownloadManager._QUERY_BATCH_SIZE):
+            chunk_end = chunk_start + DownloadManager._QUERY_BATCH_SIZE
+            chunk = repos[chunk_start:chunk_end]
+            fragments = [
+                GITHUB_API_QUERIES[query].substitute(alias=f"repo{index}", owner=repo["owner"], name=repo["name"], **kwargs)
+                for index, repo in enumerate(chunk, start=chunk_start)
+            ]
+            res = await DownloadManager._client.post("https://api.github.com/graphql", json={"query": f"{{{''.join(fragments)}\n}}"})
+            if res.status_code == 200:
+                data.update(res.json()["data"])
+            else:
+                raise Exception(f"Query '{query}' failed to run by returning code of {res.status_code}: {res.json()}")
+        await gather(*[DownloadManager._fetch_commit_history_pages(repo["owner"], repo["name"], data.get(alias), **kwargs) for alias, repo in aliases.items()])
+        return {"data": data}
+
+    @staticmethod
+    async def _fetch_commit_history_pages(owner: str, name: str, repository: Optional[Dict], **kwargs):
+        """
+        Fetch the remaining commit history pages of one repository from a batched query response.
+        Queries 100 new results each time until no more results are left, merging result nodes into the given sub-response in place.
+        Every repository is followed up independently, so all follow-up chains can run concurrently via `gather`.
+        :param owner: Repository owner login.
+        :param name: Repository name.
+        :param repository: The aliased repository sub-response to extend, may be None for inaccessible repositories.
+        :param kwargs: Parameters for substitution of variables in the follow-up query.
+        """
+        if repository is None or repository["defaultBranchRef"] is None:
+            return
+        history = repository["defaultBranchRef"]["target"]["history"]
+        page_info = history["pageInfo"]
+        while page_info["hasNextPage"]:
+            pagination = f'first: 100, after: "{page_info["endCursor"]}"'
+            res = await DownloadManager._fetch_graphql_query("repo_committed_dates", owner=owner, name=name, pagination=pagination, **kwargs)
+            new_page_list, page_info = DownloadManager._find_pagination_and_data_list(res)
+            history["nodes"] += new_page_list
+        history["pageInfo"] = dict(hasNextPage=False)
+
     @staticmethod
     def _find_pagination_and_data_list(response: Dict) -> Tuple[List, Dict]:
         """
@@ -288,7 +362,9 @@ class DownloadManager:
         """
         key = f"{query}_{md5(dumps(kwargs, sort_keys=True).encode('utf-8')).digest()}"
         if key not in DownloadManager._REMOTE_RESOURCES_CACHE:
-            if "$pagination" in GITHUB_API_QUERIES[query]:
+            if "$alias" in GITHUB_API_QUERIES[query].template:
+                res = await DownloadManager._fetch_graphql_batched(query, **kwargs)
+            elif "$pagination" in GITHUB_API_QUERIES[query].template:
                 res = await DownloadManager._fetch_graphql_paginated(query, **kwargs)
             else:
                 res = await DownloadManager._fetch_graphql_query(query, **kwargs)
@@ -1,7 +1,8 @@
-from base64 import b64decode
-from re import sub
+from base64 import b64decode, b64encode
+from hashlib import sha256
+from typing import Optional
 
-from github import Github, AuthenticatedUser, Repository, ContentFile, InputGitAuthor, UnknownObjectException
+from github import Github, AuthenticatedUser, Repository, ContentFile, InputGitAuthor, InputGitTreeElement
 
 from manager_environment import EnvironmentManager as EM
 
@@ -20,10 +21,11 @@ class GitHubManager:
     REPO: Repository
     _README: ContentFile
     _README_CONTENTS: str
+    _CURRENT_BLOCK_HASH: Optional[bytes] = None
+    _CHART_PATH: Optional[str] = None
 
     _START_COMMENT = f"<!--START_SECTION:{EM.SECTION_NAME}-->"
     _END_COMMENT = f"<!--END_SECTION:{EM.SECTION_NAME}-->"
-    _README_REGEX = f"{_START_COMMENT}[\\s\\S]+{_END_COMMENT}"
 
     @staticmethod
     def prepare_github_env():
@@ -33,6 +35,7 @@ class GitHubManager:
         - Named repo of the user [username]/[username].
         - README.md file of this repo.
         - Parsed contents of the file.
+        - Hash of the stats section currently embedded in the file.
         """
         github = Github(EM.GH_TOKEN)
         GitHubManager.USER = github.get_user()
@@ -40,16 +43,28 @@ class GitHubManager:
         GitHubManager._README = GitHubManager.REPO.get_readme()
         GitHubManager._README_CONTENTS = str(b64decode(GitHubManager._README.content), "utf-8")
 
+        start = GitHubManager._README_CONTENTS.find(GitHubManager._START_COMMENT)
+        end = GitHubManager._README_CONTENTS.find(GitHubManager._END_COMMENT, start)
+        if start != -1 and end != -1:
+            block_start = start + len(GitHubManager._START_COMMENT)
+            GitHubManager._CURRENT_BLOCK_HASH = sha256(GitHubManager._README_CONTENTS[block_start:end].encode("utf-8")).digest()
+
     @staticmethod
     def _generate_new_readme(stats: str) -> str:
         """
         Generates new README.md file, inserts its contents between start and end tags.
+        Both tags are fixed literal strings, so the section is located with two linear `str.find` scans instead of a regex.
+        If either tag is missing, the README.md contents are returned unchanged.
 
         :param stats: contents to insert.
         :returns: new README.md string.
         """
+        start = GitHubManager._README_CONTENTS.find(GitHubManager._START_COMMENT)
+        end = GitHubManager._README_CONTENTS.find(GitHubManager._END_COMMENT, start)
+        if start == -1 or end == -1:
+            return GitHubManager._README_CONTENTS
         readme_stats = f"{GitHubManager._START_COMMENT}\n{stats}\n{GitHubManager._END_COMMENT}"
-        return sub(GitHubManager._README_REGEX, readme_stats, GitHubManager._README_CONTENTS)
+        return f"{GitHubManager._README_CONTENTS[:start]}{readme_stats}{GitHubManager._README_CONTENTS[end + len(GitHubManager._END_COMMENT):]}"
 
     @staticmethod
     def _get_author() -> InputGitAuthor:
@@ -77,37 +92,41 @@ class GitHubManager:
     @staticmethod
     def update_readme(stats: str) -> bool:
         """
-        Updates readme with given data if necessary.
+        Updates readme and the queued lines of code chart with given data if necessary.
+        Compares the hash of the new stats against the section currently embedded in the readme first, skipping README.md generation entirely on no-op runs.
+        README.md and the chart are pushed together as one git tree commit, halving the number of GitHub API round-trips.
         Uses commit author, commit message and branch name specified by environmental variables.
 
         :returns: whether the README.md file was updated or not.
         """
-        new_readme = GitHubManager._generate_new_readme(stats)
-        if new_readme != GitHubManager._README_CONTENTS:
-            GitHubManager.REPO.update_file(
-                path=GitHubManager._README.path,
-                message=EM.COMMIT_MESSAGE,
-                content=new_readme,
-                sha=GitHubManager._README.sha,
-                branch=GitHubManager.branch(),
-                committer=GitHubManager._get_author(),
-            )
-            return True
-        else:
+        new_readme = None
+        if sha256(f"\n{stats}\n".encode("utf-8")).digest() != GitHubManager._CURRENT_BLOCK_HASH:
+            generated_readme = GitHubManager._generate_new_readme(stats)
+            if generated_readme != GitHubManager._README_CONTENTS:
+                new_readme = generated_readme
+        if new_readme is None and GitHubManager._CHART_PATH is None:
             return False
 
+        tree_elements = list()
+        if new_readme is not None:
+            tree_elements.append(InputGitTreeElement(GitHubManager._README.path, "100644", "blob", content=new_readme))
+        if GitHubManager._CHART_PATH is not None:
+            with open(GitHubManager._CHART_PATH, "rb") as input_file:
+                chart_blob = GitHubManager.REPO.create_git_blob(str(b64encode(input_file.read()), "utf-8"), "base64")
+            tree_elements.append(InputGitTreeElement(GitHubManager._CHART_PATH, "100644", "blob", sha=chart_blob.sha))
+
+        ref = GitHubManager.REPO.get_git_ref(f"heads/{GitHubManager.branch()}")
+        parent = GitHubManager.REPO.get_git_commit(ref.object.sha)
+        tree = GitHubManager.REPO.create_git_tree(tree_elements, base_tree=parent.tree)
+        commit = GitHubManager.REPO.create_git_commit(EM.COMMIT_MESSAGE, tree, [parent], committer=GitHubManager._get_author())
+        ref.edit(commit.sha)
+        return new_readme is not None
+
     @staticmethod
     def update_chart(chart_path: str):
         """
-        Updates lines of code chart.
-        Uses commit author, commit message and branch name specified by environmental variables.
+        Queues lines of code chart to be committed together with README.md by `update_readme`.
 
         :param chart_path: path to saved lines of code chart.
         """
-        with open(chart_path, "rb") as input_file:
-            data = input_file.read()
-        try:
-            contents = GitHubManager.REPO.get_contents(chart_path)
-            GitHubManager.REPO.update_file(contents.path, "Charts Updated", data, contents.sha, committer=GitHubManager._get_author())
-        except UnknownObjectException:
-            GitHubManager.REPO.create_file(chart_path, "Charts Added", data, committer=GitHubManager._get_author())
+        GitHubManager._CHART_PATH = chart_path
@@ -1,5 +1,3 @@
-from re import search
-from datetime import datetime
 from typing import Dict
 
 from manager_download import DownloadManager as DM
@@ -41,9 +39,10 @@ async def update_yearly_data_with_commit_stats(repo_details: Dict, yearly_data:
     for branch in branch_data["data"]["repository"]["refs"]["nodes"]:
         commit_data = await DM.get_remote_graphql("repo_commit_list", owner=owner, name=repo_details["name"], branch=branch["name"], id=GHM.USER.node_id)
         for commit in commit_data["data"]["repository"]["ref"]["target"]["history"]["nodes"]:
-            date = search(r"\d+-\d+-\d+", commit["committedDate"]).group()
-            curr_year = datetime.fromisoformat(date).year
-            quarter = (datetime.fromisoformat(date).month - 1) // 3 + 1
+            # The committed date has fixed ISO format (YYYY-MM-DDTHH:MM:SSZ), so year and month are sliced out directly.
+            committed_date = commit["committedDate"]
+            curr_year = int(committed_date[0:4])
+            quarter = (int(committed_date[5:7]) - 1) // 3 + 1
 
             if repo_details["primaryLanguage"] is not None:
                 if curr_year not in yearly_data: